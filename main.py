@@ -1,5 +1,6 @@
 import asyncio
-import queue
+import concurrent.futures
+import sys
 import threading
 import customtkinter as ctk
 from src.config import AppConfig
@@ -9,6 +10,21 @@ from src.ble_handler import BLEHandler
 from src.discord_presence import DiscordPresence
 from src.vrchat import VRChatOSC
 
+# Use a faster event loop implementation when one is installed; both are
+# drop-in replacements and we fall back to the stdlib loop silently.
+if sys.platform == 'win32':
+    try:
+        import winloop
+        winloop.install()
+    except ImportError:
+        pass
+else:
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 class MainApplication:
     """
     The main application class that orchestrates all components.
@@ -16,23 +32,35 @@ class MainApplication:
     def __init__(self, root: ctk.CTk):
         self.root = root
         self.config = AppConfig()
-        self.data_queue = queue.Queue()
-        
+        # The BLE handler publishes the newest sample on a plain attribute
+        # and sets this event to wake the consumer task.
+        self.data_event = asyncio.Event()
+
+        # One long-lived asyncio loop in a daemon thread drives all BLE and
+        # Discord coroutines; components submit work via run_coroutine_threadsafe.
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name="asyncio-loop", daemon=True).start()
+
         # Initialize GUI first to get the log_text widget
         self.gui = GuiManager(root, self.config, None, self._get_gui_callbacks()) # type: ignore
-        
+
         # Now initialize the logger with the actual widget
         self.logger = Logger(self.gui.log_text)
         self.gui.logger = self.logger # Assign the logger back to the GUI manager
-        
-        self.ble_handler = BLEHandler(self.data_queue, self.logger)
+
+        self.ble_handler = BLEHandler(self.data_event, self.logger)
         client_id = self.config.get('discord_client_id') or '1285817369662328904'
         self.discord_presence = DiscordPresence(client_id, self.logger)
         self.vrchat_osc = VRChatOSC(self.logger)
 
         self.running = True
-        self.monitor_thread = None
+        self._reconfig_event = asyncio.Event()
         self.last_heart_rate = None
+        self._last_logged_hr = None
+        self._prev_dots = None
+        # Sentinels so the very first update always reaches the widgets/services.
+        self._shown_hr = object()
+        self._prev_hr_pushed = object()
 
     def _get_gui_callbacks(self) -> dict:
         """Returns a dictionary of callbacks for the GUI."""
@@ -50,79 +78,117 @@ class MainApplication:
         self.config.apply_theme()
         self.logger.process_pending_logs()
 
-        # Start the main monitoring loop in a separate thread
-        self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
-        self.monitor_thread.start()
+        # Start the BLE supervisor and heart rate consumer on the shared loop
+        asyncio.run_coroutine_threadsafe(self._ble_supervisor(), self.loop)
+        asyncio.run_coroutine_threadsafe(self._hr_consumer(), self.loop)
 
-        # Start the periodic UI update
+        # Start the periodic status refresh
         self.root.after(1000, self.update_ui)
         
         # Start the GUI main loop
         self.gui.run()
 
-    def monitor_loop(self):
-        """The main loop for fetching heart rate data."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
+    async def _ble_supervisor(self):
+        """Keeps the heart rate source connected, reacting to config changes."""
         while self.running:
-            hr_source = self.config.get('hr_source', 'pulsoid')
-            if hr_source == 'bluetooth':
+            if self.config.hr_source == 'bluetooth':
                 if not self.ble_handler.is_connected and not self.ble_handler.is_scanning:
                     # For simplicity, auto-connect to the first found device
                     # A real implementation would let the user choose from the GUI
-                    devices = loop.run_until_complete(self.ble_handler.scan_for_devices())
+                    devices = await self.ble_handler.scan_for_devices()
                     if devices:
-                        loop.run_until_complete(self.ble_handler.connect(devices[0].address))
+                        await self.ble_handler.connect(devices[0].address)
             # Pulsoid logic would go here
-            
-            # This loop can be expanded to handle both sources
-            threading.Event().wait(5) # Wait for 5 seconds before next cycle
 
-    def update_ui(self):
-        """Periodically updates the UI with new data."""
+            # Sleep until the next cycle, waking early on a source change
+            try:
+                await asyncio.wait_for(self._reconfig_event.wait(), timeout=5)
+                self._reconfig_event.clear()
+            except asyncio.TimeoutError:
+                pass
+
+    async def _hr_consumer(self):
+        """Forwards new heart rate samples from the BLE loop to the Tk thread."""
+        while self.running:
+            await self.data_event.wait()
+            self.data_event.clear()
+            heart_rate = self.ble_handler.latest_hr
+            if heart_rate is None:
+                continue
+            self.root.after(0, self._apply_hr, heart_rate)
+
+    def _apply_hr(self, heart_rate):
+        """Applies a new heart rate sample: GUI label, log, and external pushes."""
         if not self.running:
             return
-            
+
         try:
-            # Process all items in the queue
-            while not self.data_queue.empty():
-                self.last_heart_rate = self.data_queue.get_nowait()
-                self.logger.save_heart_rate_log(self.last_heart_rate)
-
-            # Update GUI elements
-            self.gui.update_heart_rate(self.last_heart_rate)
-            self.gui.update_status_dots(self.discord_presence.is_connected, self.vrchat_osc.is_connected and self.vrchat_osc.is_vrchat_running())
-
-            # Update external services
-            if self.config.get('discord_enabled'):
-                self.discord_presence.update_presence(self.last_heart_rate, is_vrchat_running=self.vrchat_osc.is_vrchat_running())
-            
-            if self.config.get('vrchat_enabled'):
-                self.vrchat_osc.update_parameters(self.last_heart_rate)
+            self.last_heart_rate = heart_rate
+            # Persist only when the value changed; the logger's writer
+            # thread keeps disk latency off the Tk thread
+            if heart_rate != self._last_logged_hr:
+                self._last_logged_hr = heart_rate
+                self.logger.save_heart_rate_log(heart_rate)
+
+            # Only touch the widget when the displayed value actually changes
+            if heart_rate != self._shown_hr:
+                with self.gui.batch_updates():
+                    self.gui.update_heart_rate(heart_rate)
+                self._shown_hr = heart_rate
+                self.root.update_idletasks()
+
+            # Update external services only when the heart rate changed
+            if heart_rate != self._prev_hr_pushed:
+                vrchat_running = self.vrchat_osc.is_vrchat_running()
+                if self.config.discord_enabled:
+                    self.discord_presence.update_presence(heart_rate, is_vrchat_running=vrchat_running)
+
+                if self.config.vrchat_enabled:
+                    self.vrchat_osc.update_parameters(heart_rate)
+
+                self._prev_hr_pushed = heart_rate
 
         except Exception as e:
             self.logger.log_activity(f"UI update error: {e}")
 
+    def update_ui(self):
+        """Heartbeat tick: refreshes the connection status indicators."""
+        if not self.running:
+            return
+
+        try:
+            vrchat_running = self.vrchat_osc.is_vrchat_running()
+            dots = (self.discord_presence.is_connected, self.vrchat_osc.is_connected and vrchat_running)
+            # Reconfigure the dots only on a state change, with one redraw pass
+            if dots != self._prev_dots:
+                with self.gui.batch_updates():
+                    self.gui.update_status_dots(*dots)
+                self._prev_dots = dots
+                self.root.update_idletasks()
+        except Exception as e:
+            self.logger.log_activity(f"UI update error: {e}")
+
         # Schedule the next update
         self.root.after(1000, self.update_ui)
 
     def on_closing(self):
         """Handles the application closing event."""
         self.running = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=2)
-        
+        # Wake the supervisor so it notices we're shutting down
+        self.loop.call_soon_threadsafe(self._reconfig_event.set)
+
         if self.discord_presence.is_connected:
             self.discord_presence.close()
             
         if self.ble_handler.is_connected:
-            loop = asyncio.new_event_loop()
-            loop.run_until_complete(self.ble_handler.disconnect())
-            loop.close()
+            try:
+                asyncio.run_coroutine_threadsafe(self.ble_handler.disconnect(), self.loop).result(timeout=5)
+            except concurrent.futures.TimeoutError:
+                self.logger.log_activity("Timed out waiting for BLE disconnect.")
 
         self.config.set('window_geometry', self.root.geometry())
-        self.config.save_config()
+        self.config.flush()
+        self.logger.close()
         self.root.destroy()
 
     def apply_settings(self):
@@ -131,9 +197,9 @@ class MainApplication:
         self.logger.log_activity("Settings applied.")
         
         # Reconnect services if necessary
-        if self.config.get('discord_enabled') and not self.discord_presence.is_connected:
+        if self.config.discord_enabled and not self.discord_presence.is_connected:
             self.discord_presence.connect()
-        elif not self.config.get('discord_enabled') and self.discord_presence.is_connected:
+        elif not self.config.discord_enabled and self.discord_presence.is_connected:
             self.discord_presence.close()
 
     def toggle_discord(self):
@@ -159,16 +225,39 @@ class MainApplication:
         self.config.apply_theme()
         self.logger.log_activity(f"Theme changed to {theme}.")
 
+    def _reset_hr_outputs(self):
+        """Clears the HR display and external services back to the idle state."""
+        try:
+            with self.gui.batch_updates():
+                self.gui.update_heart_rate(None)
+            self.root.update_idletasks()
+
+            if self.config.discord_enabled:
+                self.discord_presence.update_presence(None, is_vrchat_running=self.vrchat_osc.is_vrchat_running())
+            if self.config.vrchat_enabled:
+                self.vrchat_osc.update_parameters(None)
+
+            # Re-arm the change gates so the next real sample goes through
+            self._shown_hr = None
+            self._prev_hr_pushed = None
+            self._last_logged_hr = None
+        except Exception as e:
+            self.logger.log_activity(f"UI update error: {e}")
+
     def change_hr_source(self, source: str):
         """Changes the heart rate source."""
         self.config.set('hr_source', source.lower())
         self.logger.log_activity(f"Heart rate source changed to {source}.")
-        # Reset connection state
+        # Reset connection state and clear the stale readings everywhere
         self.last_heart_rate = None
+        self._reset_hr_outputs()
         if self.ble_handler.is_connected:
-            loop = asyncio.new_event_loop()
-            loop.run_until_complete(self.ble_handler.disconnect())
-            loop.close()
+            try:
+                asyncio.run_coroutine_threadsafe(self.ble_handler.disconnect(), self.loop).result(timeout=5)
+            except concurrent.futures.TimeoutError:
+                self.logger.log_activity("Timed out waiting for BLE disconnect.")
+        # Wake the supervisor immediately instead of waiting out its sleep
+        self.loop.call_soon_threadsafe(self._reconfig_event.set)
 
 if __name__ == "__main__":
     try:
@@ -1,10 +1,8 @@
 import asyncio
-import struct
 from bleak import BleakScanner, BleakClient
 from bleak.exc import BleakError
 from bleak.backends.characteristic import BleakGATTCharacteristic
 from typing import Optional
-from queue import Queue
 from .logger import Logger
 
 HR_SERVICE_UUID = "0000180d-0000-1000-8000-00805f9b34fb"
@@ -14,16 +12,17 @@ class BLEHandler:
     """
     Handles BLE scanning, connection, and data reception for heart rate monitors.
     """
-    def __init__(self, data_queue: Queue, logger: Logger):
+    def __init__(self, data_event: asyncio.Event, logger: Logger):
         """
         Initializes the BLE handler.
 
         Args:
-            data_queue (Queue): A thread-safe queue to send heart rate data to.
+            data_event (asyncio.Event): Event set when a new sample arrives.
             logger (Logger): The application logger instance.
         """
-        self.data_queue = data_queue
+        self.data_event = data_event
         self.logger = logger
+        self.latest_hr = None
         self.client: Optional[BleakClient] = None
         self.is_connected = False
         self.is_scanning = False
@@ -32,19 +31,31 @@ class BLEHandler:
     async def scan_for_devices(self, timeout=5.0) -> list:
         """
         Scans for nearby BLE devices that advertise the heart rate service.
+        Returns as soon as the first matching advertisement arrives instead
+        of waiting out the full scan window.
 
         Args:
-            timeout (float): The duration of the scan in seconds.
+            timeout (float): The maximum duration of the scan in seconds.
 
         Returns:
-            list: A list of discovered devices.
+            list: A list containing the first discovered device, or an empty list.
         """
         self.is_scanning = True
         self.logger.log_activity("Scanning for BLE heart rate devices...")
+        found = asyncio.get_running_loop().create_future()
+
+        def _on_detection(device, advertisement_data):
+            if not found.done():
+                found.set_result(device)
+
         try:
-            devices = await BleakScanner.discover(timeout=timeout, service_uuids=[HR_SERVICE_UUID])
-            self.logger.log_activity(f"Found {len(devices)} devices.")
-            return list(devices)
+            async with BleakScanner(detection_callback=_on_detection, service_uuids=[HR_SERVICE_UUID]):
+                device = await asyncio.wait_for(found, timeout)
+            self.logger.log_activity(f"Found device: {device.name or device.address}")
+            return [device]
+        except asyncio.TimeoutError:
+            self.logger.log_activity("No heart rate devices found.")
+            return []
         except BleakError as e:
             self.logger.log_activity(f"BLE scanning error: {e}")
             return []
@@ -100,21 +111,21 @@ class BLEHandler:
     def _notification_handler(self, sender: BleakGATTCharacteristic, data: bytearray):
         """
         Callback for handling heart rate notifications from the BLE device.
-        Parses the data and puts the heart rate value into the queue.
+        Parses the data and publishes the value via `latest_hr`.
 
         Args:
             sender (BleakGATTCharacteristic): The characteristic that sent the notification.
             data (bytearray): The notification data.
         """
         # Heart rate data format can vary. This is a common implementation.
-        # The first byte contains flags, the rest is the heart rate.
-        flags = data[0]
-        hr_format = (flags & 0x01)  # 0 = UINT8, 1 = UINT16
-
-        if hr_format == 1:  # UINT16
-            heart_rate = struct.unpack('<H', data[1:3])[0]
-        else:  # UINT8
-            heart_rate = struct.unpack('<B', data[1:2])[0]
+        # The first byte contains flags; bit 0 selects UINT8 vs little-endian
+        # UINT16. Indexing a bytearray already yields ints, so the value is
+        # read directly instead of going through struct on every notification.
+        heart_rate = data[1] | ((data[2] << 8) if data[0] & 0x01 else 0)
 
-        if heart_rate > 0:
-            self.data_queue.put(heart_rate)
\ No newline at end of file
+        if heart_rate:
+            # A plain attribute store is GIL-atomic; readers always see a
+            # complete value. The bleak callback runs on the shared event
+            # loop's thread, so setting the event directly is safe.
+            self.latest_hr = heart_rate
+            self.data_event.set()
\ No newline at end of file
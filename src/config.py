@@ -3,10 +3,24 @@ import os
 import threading
 import customtkinter as ctk
 
+# orjson serializes several times faster than the stdlib encoder;
+# fall back to json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sentinel to distinguish "key absent" from a stored None in set()
+_MISSING = object()
+
 class AppConfig:
     """
     Manages the application's configuration, loading from and saving to a JSON file.
     """
+    # Keys read on every UI tick; mirrored as plain attributes so hot
+    # paths skip the lock and dict lookup in get().
+    HOT_KEYS = ('discord_enabled', 'vrchat_enabled', 'hr_source')
+
     def __init__(self, config_file="heartrate_config.json"):
         """
         Initializes the configuration manager.
@@ -17,6 +31,8 @@ class AppConfig:
         self.config_file = config_file
         self.config = {}
         self.lock = threading.Lock()
+        self._save_timer = None
+        self._dirty = False
         self.load_config()
 
     def load_config(self):
@@ -34,17 +50,66 @@ class AppConfig:
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Error loading config file: {e}. Using default configuration.")
                 self.config = self.get_default_config()
+        self._refresh_hot_keys()
+
+    def _refresh_hot_keys(self):
+        """Mirrors frequently-read keys onto plain attributes."""
+        defaults = self.get_default_config()
+        for key in self.HOT_KEYS:
+            setattr(self, key, self.config.get(key, defaults[key]))
 
     def save_config(self):
         """
-        Saves the current configuration to the JSON file.
+        Schedules a save of the current configuration.
+        Saves are debounced so rapid successive calls (e.g. from GUI
+        clicks) result in a single disk write. Does nothing if no value
+        changed since the last write.
         """
+        if not self._dirty:
+            return
         with self.lock:
-            try:
-                with open(self.config_file, 'w') as f:
-                    json.dump(self.config, f, indent=4)
-            except IOError as e:
-                print(f"Error saving config file: {e}")
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(0.5, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """
+        Cancels any pending debounced save and writes the configuration
+        to disk immediately. Called on shutdown.
+        """
+        if not self._dirty:
+            return
+        with self.lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self._flush()
+
+    def _flush(self):
+        """
+        Writes the configuration to disk atomically via a temp file.
+        The lock is held only while grabbing the snapshot, not during I/O.
+        """
+        with self.lock:
+            self._save_timer = None
+            # set() never mutates the dict in place, so the reference
+            # itself is a stable snapshot.
+            snapshot = self.config
+
+        tmp_file = self.config_file + ".tmp"
+        try:
+            if orjson is not None:
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w') as f:
+                    json.dump(snapshot, f, indent=4)
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
+        except (IOError, OSError) as e:
+            print(f"Error saving config file: {e}")
 
     def get(self, key, default=None):
         """
@@ -56,9 +121,12 @@ class AppConfig:
 
         Returns:
             The configuration value or the default value.
+
+        Reads are lock-free: set() swaps in a new dict atomically instead
+        of mutating the current one, so readers always see a consistent
+        snapshot.
         """
-        with self.lock:
-            return self.config.get(key, default)
+        return self.config.get(key, default)
 
     def set(self, key, value):
         """
@@ -69,7 +137,16 @@ class AppConfig:
             value: The value to set.
         """
         with self.lock:
-            self.config[key] = value
+            if self.config.get(key, _MISSING) == value:
+                return
+            # Copy-on-write: build a new dict and swap it in atomically so
+            # concurrent lock-free readers never see a half-updated mapping.
+            new_config = dict(self.config)
+            new_config[key] = value
+            self.config = new_config
+            self._dirty = True
+        if key in self.HOT_KEYS:
+            setattr(self, key, value)
 
     def get_default_config(self):
         """
@@ -1,5 +1,4 @@
 import time
-import asyncio
 from typing import Optional
 from pypresence import Presence, exceptions
 from .utils import is_discord_running
@@ -21,6 +20,15 @@ class DiscordPresence:
         self.logger = logger
         self.rpc = None
         self.is_connected = False
+        self._last_pushed = None
+        # Static presence fields are built once; update_presence only
+        # mutates the keys that depend on its inputs.
+        self._presence = {
+            'start': int(time.time()),
+            'large_image': 'fas-fa-heart',
+            'small_image': None,
+            'large_text': 'Heart Rate Monitor',
+        }
 
     def connect(self):
         """
@@ -35,9 +43,13 @@ class DiscordPresence:
             return
 
         try:
-            self.rpc = Presence(self.client_id, loop=asyncio.get_event_loop())
+            # The sync pypresence client manages its own private loop;
+            # injecting the shared one would be discarded by connect()
+            # and only clobber the Tk thread's default event loop.
+            self.rpc = Presence(self.client_id)
             self.rpc.connect()
             self.is_connected = True
+            self._presence['start'] = int(time.time())
             self.logger.log_activity("Discord Rich Presence connected.")
         except (exceptions.DiscordNotFound, exceptions.InvalidPipe, FileNotFoundError) as e:
             self.logger.log_activity(f"Could not connect to Discord: {e}")
@@ -59,6 +71,7 @@ class DiscordPresence:
             finally:
                 self.rpc = None
                 self.is_connected = False
+                self._last_pushed = None
 
     def update_presence(self, heart_rate: Optional[int], custom_large_image: Optional[str] = None, custom_small_image: Optional[str] = None, is_vrchat_running: bool = False):
         """
@@ -73,19 +86,23 @@ class DiscordPresence:
         if not self.is_connected or not self.rpc:
             return
 
+        # Nothing changed since the last push; skip the IPC round-trip.
+        pushed = (heart_rate, is_vrchat_running, custom_large_image, custom_small_image)
+        if pushed == self._last_pushed:
+            return
+
         try:
             if not is_discord_running():
                 self.logger.log_activity("Discord connection lost.")
                 self.close()
                 return
 
-            presence_data = {
-                'start': int(time.time()),
-                'large_image': custom_large_image or 'fas-fa-heart',
-                'small_image': custom_small_image,
-                'large_text': 'Heart Rate Monitor',
-                'small_text': 'VRChat Integration Active' if is_vrchat_running else 'VRChat Offline'
-            }
+            presence_data = self._presence
+            # Re-derive the images every push so dropping a custom image
+            # falls back to the defaults instead of sticking
+            presence_data['large_image'] = custom_large_image or 'fas-fa-heart'
+            presence_data['small_image'] = custom_small_image or None
+            presence_data['small_text'] = 'VRChat Integration Active' if is_vrchat_running else 'VRChat Offline'
 
             if heart_rate is not None:
                 presence_data['details'] = f'❤ Heart Rate: {heart_rate} BPM'
@@ -95,6 +112,7 @@ class DiscordPresence:
                 presence_data['state'] = 'Waiting for connection...'
 
             self.rpc.update(**presence_data)
+            self._last_pushed = pushed
         except (exceptions.InvalidID, exceptions.ConnectionTimeout) as e:
             self.logger.log_activity(f"Discord presence update failed: {e}")
             self.close()
@@ -1,9 +1,23 @@
+import functools
 import customtkinter as ctk
+from contextlib import contextmanager
 from tkinter import messagebox, colorchooser
 from typing import Callable, Optional
 from .config import AppConfig
 from .logger import Logger
 
+# Sentinel for "no value applied yet" in the widget-state cache
+_UNSET = object()
+
+@functools.lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Returns a shared CTkFont for the given size and weight.
+    Every CTkFont allocates a new Tk named font, so widgets with the same
+    styling reuse one instance instead of creating their own.
+    """
+    return ctk.CTkFont(size=size, weight=weight)
+
 class GuiManager:
     """
     Manages the entire user interface of the Heart Rate Monitor application.
@@ -22,11 +36,69 @@ class GuiManager:
         self.config = config
         self.logger = logger
         self.callbacks = callbacks
+        # Resolve callbacks up front: one dict.get per event wiring instead
+        # of one per fire, and a missing 'on_closing' can't silently leave
+        # WM_DELETE_WINDOW unhandled.
+        self._cb_close = callbacks.get('on_closing') or self.root.destroy
+        self._cb_toggle_discord = callbacks.get('toggle_discord')
+        self._cb_toggle_vrchat = callbacks.get('toggle_vrchat')
+        self._cb_change_theme = callbacks.get('change_theme')
+        self._cb_change_hr_source = callbacks.get('change_hr_source')
+        self._cb_apply_settings = callbacks.get('apply_settings')
         self.settings_window: Optional[ctk.CTkToplevel] = None
+        self._batch_depth = 0
+        self._pending = {}
+        self._applied = {}
+        self._last_hr = _UNSET
+        self._last_discord = _UNSET
+        self._last_vrchat = _UNSET
+        self._settings_tabview: Optional[ctk.CTkTabview] = None
+        self._tabs_built = set()
+        self.api_key_entry: Optional[ctk.CTkEntry] = None
+        self.discord_id_entry: Optional[ctk.CTkEntry] = None
+        self.large_image_entry: Optional[ctk.CTkEntry] = None
+        self.small_image_entry: Optional[ctk.CTkEntry] = None
 
         self._setup_main_window()
         self._setup_ui()
 
+    @contextmanager
+    def batch_updates(self):
+        """
+        Context manager that coalesces widget updates staged inside it
+        into a single configure call per widget on exit. Reentrant, so
+        callers can nest it freely.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                pending, self._pending = self._pending, {}
+                for widget, kwargs in pending.items():
+                    self._configure(widget, kwargs)
+
+    def _stage(self, widget, **kwargs):
+        """
+        Stages a widget configuration, dropping values identical to what
+        was last applied. Applied immediately outside batch_updates().
+        """
+        changed = {key: value for key, value in kwargs.items()
+                   if self._applied.get((widget, key), _UNSET) != value}
+        if not changed:
+            return
+        if self._batch_depth:
+            self._pending.setdefault(widget, {}).update(changed)
+        else:
+            self._configure(widget, changed)
+
+    def _configure(self, widget, kwargs):
+        """Applies a configuration and records it in the state cache."""
+        widget.configure(**kwargs)
+        for key, value in kwargs.items():
+            self._applied[(widget, key)] = value
+
     def _setup_main_window(self):
         """Configures the main application window."""
         self.root.title("Heart Rate Monitor")
@@ -46,33 +118,33 @@ class GuiManager:
         else:
             self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
 
-        self.root.protocol("WM_DELETE_WINDOW", self.callbacks.get('on_closing'))
+        self.root.protocol("WM_DELETE_WINDOW", self._cb_close)
 
     def _setup_ui(self):
         """Sets up the main user interface elements."""
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_rowconfigure(3, weight=1)
 
-        # Main status frame
+        # Main status frame; children sit directly on it instead of in a
+        # transparent wrapper, saving a canvas layer and geometry passes
         main_status_frame = ctk.CTkFrame(self.root)
         main_status_frame.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="ew")
-        main_status_frame.grid_columnconfigure(0, weight=1)
+        main_status_frame.grid_columnconfigure(1, weight=1)
 
-        pulsoid_status = ctk.CTkFrame(main_status_frame, fg_color="transparent")
-        pulsoid_status.pack(fill='x', padx=10, pady=5)
+        # The glyph never changes; status is conveyed by color alone so
+        # updates skip Tk's text re-shaping and only repaint
+        self.pulsoid_status_icon = ctk.CTkLabel(main_status_frame, text="⚡", font=_font(24), text_color="red")
+        self.pulsoid_status_icon.grid(row=0, column=0, padx=(15, 5), pady=5)
 
-        self.pulsoid_status_icon = ctk.CTkLabel(pulsoid_status, text="🔌", font=ctk.CTkFont(size=24), text_color="red")
-        self.pulsoid_status_icon.pack(side="left", padx=(5, 5))
+        ctk.CTkLabel(main_status_frame, text="HeartRate Monitor", font=_font(18, "bold")).grid(row=0, column=1, sticky="w", padx=5, pady=5)
 
-        ctk.CTkLabel(pulsoid_status, text="HeartRate Monitor", font=ctk.CTkFont(size=18, weight="bold")).pack(side="left", padx=5)
-
-        settings_button = ctk.CTkButton(pulsoid_status, text="⚙️ Settings", width=100, height=32, corner_radius=8, font=ctk.CTkFont(size=14), command=self.show_settings_window)
-        settings_button.pack(side="right", padx=5)
+        settings_button = ctk.CTkButton(main_status_frame, text="⚙️ Settings", width=100, height=32, corner_radius=8, font=_font(14), command=self.show_settings_window)
+        settings_button.grid(row=0, column=2, padx=(5, 15), pady=5)
 
         # Heart Rate Display
         hr_frame = ctk.CTkFrame(self.root)
         hr_frame.grid(row=1, column=0, padx=15, pady=10, sticky="nsew")
-        self.hr_label = ctk.CTkLabel(hr_frame, text="Please Wait...", font=ctk.CTkFont(size=48, weight="bold"))
+        self.hr_label = ctk.CTkLabel(hr_frame, text="Please Wait...", font=_font(48, "bold"))
         self.hr_label.pack(pady=(15, 10))
 
         # Status Display
@@ -80,27 +152,25 @@ class GuiManager:
         status_frame.grid(row=2, column=0, padx=15, pady=10, sticky="nsew")
         center_container = ctk.CTkFrame(status_frame, fg_color="transparent")
         center_container.pack(expand=True, fill='x', padx=15, pady=10)
-        center_container.grid_columnconfigure((0, 1), weight=1)
+        # Flexible edge columns keep the two status groups centered
+        # without per-group wrapper frames
+        center_container.grid_columnconfigure((0, 5), weight=1)
 
         # Discord Status
-        discord_status_frame = ctk.CTkFrame(center_container, fg_color="transparent")
-        discord_status_frame.grid(row=0, column=0, sticky="e", padx=(0, 20))
-        self.discord_dot = ctk.CTkLabel(discord_status_frame, text="●", font=ctk.CTkFont(size=22), text_color="red")
-        self.discord_dot.pack(side='left', padx=(5, 5))
-        ctk.CTkLabel(discord_status_frame, text="Discord", font=ctk.CTkFont(size=16, weight="bold")).pack(side='left', padx=5)
-        self.discord_toggle = ctk.CTkSwitch(discord_status_frame, text="", command=self.callbacks.get('toggle_discord'), width=40)
-        self.discord_toggle.pack(side='left', padx=10)
+        self.discord_dot = ctk.CTkLabel(center_container, text="●", font=_font(22), text_color="red")
+        self.discord_dot.grid(row=0, column=0, sticky="e", padx=(5, 5))
+        ctk.CTkLabel(center_container, text="Discord", font=_font(16, "bold")).grid(row=0, column=1, padx=5)
+        self.discord_toggle = ctk.CTkSwitch(center_container, text="", command=self._cb_toggle_discord, width=40)
+        self.discord_toggle.grid(row=0, column=2, padx=(10, 20))
         if self.config.get('discord_enabled', True):
             self.discord_toggle.select()
 
         # VRChat Status
-        vrchat_status_frame = ctk.CTkFrame(center_container, fg_color="transparent")
-        vrchat_status_frame.grid(row=0, column=1, sticky="w", padx=(20, 0))
-        self.vrchat_dot = ctk.CTkLabel(vrchat_status_frame, text="●", font=ctk.CTkFont(size=22), text_color="red")
-        self.vrchat_dot.pack(side='left', padx=(5, 5))
-        ctk.CTkLabel(vrchat_status_frame, text="VRChat", font=ctk.CTkFont(size=16, weight="bold")).pack(side='left', padx=5)
-        self.vrchat_toggle = ctk.CTkSwitch(vrchat_status_frame, text="", command=self.callbacks.get('toggle_vrchat'), width=40)
-        self.vrchat_toggle.pack(side='left', padx=10)
+        self.vrchat_dot = ctk.CTkLabel(center_container, text="●", font=_font(22), text_color="red")
+        self.vrchat_dot.grid(row=0, column=3, padx=(20, 5))
+        ctk.CTkLabel(center_container, text="VRChat", font=_font(16, "bold")).grid(row=0, column=4, padx=5)
+        self.vrchat_toggle = ctk.CTkSwitch(center_container, text="", command=self._cb_toggle_vrchat, width=40)
+        self.vrchat_toggle.grid(row=0, column=5, sticky="w", padx=10)
         if self.config.get('vrchat_enabled', True):
             self.vrchat_toggle.select()
 
@@ -109,23 +179,39 @@ class GuiManager:
         log_frame.grid(row=3, column=0, padx=15, pady=(10, 15), sticky="nsew")
         log_frame.grid_columnconfigure(0, weight=1)
         log_frame.grid_rowconfigure(1, weight=1)
-        ctk.CTkLabel(log_frame, text="Activity Log", font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, pady=10)
+        ctk.CTkLabel(log_frame, text="Activity Log", font=_font(16, "bold")).grid(row=0, column=0, pady=10)
         self.log_text = ctk.CTkTextbox(log_frame, height=200)
         self.log_text.grid(row=1, column=0, sticky="nsew", padx=15, pady=(0, 15))
 
+        # Transient inline confirmation label; placed on demand by toast()
+        self.status_toast = ctk.CTkLabel(self.root, text="", corner_radius=8, fg_color=("gray85", "gray20"))
+
+    def toast(self, message: str, ms: int = 2000):
+        """Shows a transient status message in the main window."""
+        self.status_toast.configure(text=f"  {message}  ")
+        self.status_toast.place(relx=0.5, rely=0.98, anchor="s")
+        self.root.after(ms, self.status_toast.place_forget)
+
     def update_heart_rate(self, heart_rate: Optional[int]):
-        """Updates the heart rate display."""
+        """Updates the heart rate display. No-op when the value is unchanged."""
+        if heart_rate == self._last_hr:
+            return
         if heart_rate is not None:
-            self.hr_label.configure(text=f"{heart_rate} BPM")
-            self.pulsoid_status_icon.configure(text="⚡", text_color="green")
+            self._stage(self.hr_label, text=f"{heart_rate} BPM")
+            self._stage(self.pulsoid_status_icon, text_color="green")
         else:
-            self.hr_label.configure(text="--")
-            self.pulsoid_status_icon.configure(text="🔌", text_color="red")
+            self._stage(self.hr_label, text="--")
+            self._stage(self.pulsoid_status_icon, text_color="red")
+        self._last_hr = heart_rate
 
     def update_status_dots(self, discord_status: bool, vrchat_status: bool):
-        """Updates the status indicators for Discord and VRChat."""
-        self.discord_dot.configure(text_color="green" if discord_status else "red")
-        self.vrchat_dot.configure(text_color="green" if vrchat_status else "red")
+        """Updates the status indicators for Discord and VRChat, touching only changed dots."""
+        if discord_status != self._last_discord:
+            self._stage(self.discord_dot, text_color="green" if discord_status else "red")
+            self._last_discord = discord_status
+        if vrchat_status != self._last_vrchat:
+            self._stage(self.vrchat_dot, text_color="green" if vrchat_status else "red")
+            self._last_vrchat = vrchat_status
 
     def show_settings_window(self):
         """Displays the settings window."""
@@ -139,37 +225,51 @@ class GuiManager:
         self.settings_window.transient(self.root)
         self.settings_window.grab_set()
 
-        # Create tabs
-        tabview = ctk.CTkTabview(self.settings_window)
+        # Create tabs; their contents are built lazily on first visit
+        # since widget construction dominates the window's open time
+        tabview = ctk.CTkTabview(self.settings_window, command=self._on_tab_changed)
         tabview.pack(fill="both", expand=True, padx=10, pady=10)
 
-        general_tab = tabview.add("General")
-        api_tab = tabview.add("API Keys")
-        discord_tab = tabview.add("Discord")
-        
-        self._setup_general_tab(general_tab)
-        self._setup_api_tab(api_tab)
-        self._setup_discord_tab(discord_tab)
+        self._settings_tabview = tabview
+        self._tab_builders = {
+            "General": self._setup_general_tab,
+            "API Keys": self._setup_api_tab,
+            "Discord": self._setup_discord_tab,
+        }
+        self._tabs_built = set()
+        for name in self._tab_builders:
+            tabview.add(name)
+        self._on_tab_changed()  # build the initially selected tab
 
         save_button = ctk.CTkButton(self.settings_window, text="Save & Close", command=self._save_and_close_settings)
         save_button.pack(pady=10)
 
         self.settings_window.protocol("WM_DELETE_WINDOW", self._save_and_close_settings)
 
+    def _on_tab_changed(self):
+        """Builds the contents of the selected settings tab on first visit."""
+        if self._settings_tabview is None:
+            return
+        name = self._settings_tabview.get()
+        if name in self._tabs_built:
+            return
+        self._tabs_built.add(name)
+        self._tab_builders[name](self._settings_tabview.tab(name))
+
     def _setup_general_tab(self, tab):
         """Sets up the General settings tab."""
         frame = ctk.CTkFrame(tab, fg_color="transparent")
         frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-        ctk.CTkLabel(frame, text="Theme:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 5))
-        theme_menu = ctk.CTkOptionMenu(frame, values=["System", "Light", "Dark"], command=self.callbacks.get('change_theme'))
+        ctk.CTkLabel(frame, text="Theme:", font=_font(14)).pack(anchor="w", pady=(0, 5))
+        theme_menu = ctk.CTkOptionMenu(frame, values=["System", "Light", "Dark"], command=self._cb_change_theme)
         theme = self.config.get('theme', 'dark')
         if theme:
             theme_menu.set(theme.capitalize())
         theme_menu.pack(anchor="w")
 
-        ctk.CTkLabel(frame, text="Heart Rate Source:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(20, 5))
-        source_menu = ctk.CTkOptionMenu(frame, values=["Pulsoid", "Bluetooth"], command=self.callbacks.get('change_hr_source'))
+        ctk.CTkLabel(frame, text="Heart Rate Source:", font=_font(14)).pack(anchor="w", pady=(20, 5))
+        source_menu = ctk.CTkOptionMenu(frame, values=["Pulsoid", "Bluetooth"], command=self._cb_change_hr_source)
         hr_source = self.config.get('hr_source', 'pulsoid')
         if hr_source:
             source_menu.set(hr_source.capitalize())
@@ -180,7 +280,7 @@ class GuiManager:
         frame = ctk.CTkFrame(tab, fg_color="transparent")
         frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-        ctk.CTkLabel(frame, text="Pulsoid API Key:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(frame, text="Pulsoid API Key:", font=_font(14)).pack(anchor="w", pady=(0, 5))
         self.api_key_entry = ctk.CTkEntry(frame, show="*", width=300)
         self.api_key_entry.insert(0, self.config.get('pulsoid_api_key', ''))
         self.api_key_entry.pack(anchor="w")
@@ -190,38 +290,49 @@ class GuiManager:
         frame = ctk.CTkFrame(tab, fg_color="transparent")
         frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-        ctk.CTkLabel(frame, text="Discord Client ID:", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 5))
+        ctk.CTkLabel(frame, text="Discord Client ID:", font=_font(14)).pack(anchor="w", pady=(0, 5))
         self.discord_id_entry = ctk.CTkEntry(frame, width=300)
         self.discord_id_entry.insert(0, self.config.get('discord_client_id', ''))
         self.discord_id_entry.pack(anchor="w")
 
-        ctk.CTkLabel(frame, text="Large Image URL (optional):", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(20, 5))
+        ctk.CTkLabel(frame, text="Large Image URL (optional):", font=_font(14)).pack(anchor="w", pady=(20, 5))
         self.large_image_entry = ctk.CTkEntry(frame, width=300)
         self.large_image_entry.insert(0, self.config.get('large_image') or '')
         self.large_image_entry.pack(anchor="w")
 
-        ctk.CTkLabel(frame, text="Small Image URL (optional):", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(20, 5))
+        ctk.CTkLabel(frame, text="Small Image URL (optional):", font=_font(14)).pack(anchor="w", pady=(20, 5))
         self.small_image_entry = ctk.CTkEntry(frame, width=300)
         self.small_image_entry.insert(0, self.config.get('small_image') or '')
         self.small_image_entry.pack(anchor="w")
 
     def _save_and_close_settings(self):
         """Saves the settings and closes the settings window."""
-        # Update config from UI elements
-        self.config.set('pulsoid_api_key', self.api_key_entry.get())
-        self.config.set('discord_client_id', self.discord_id_entry.get())
-        self.config.set('large_image', self.large_image_entry.get() or None)
-        self.config.set('small_image', self.small_image_entry.get() or None)
+        # Update config from UI elements; tabs never visited were never
+        # built, so their entries stay None and keep their stored values
+        if self.api_key_entry is not None:
+            self.config.set('pulsoid_api_key', self.api_key_entry.get())
+        if self.discord_id_entry is not None:
+            self.config.set('discord_client_id', self.discord_id_entry.get())
+        if self.large_image_entry is not None:
+            self.config.set('large_image', self.large_image_entry.get() or None)
+        if self.small_image_entry is not None:
+            self.config.set('small_image', self.small_image_entry.get() or None)
         
-        apply_settings_callback = self.callbacks.get('apply_settings')
-        if apply_settings_callback:
-            apply_settings_callback()
+        if self._cb_apply_settings:
+            self._cb_apply_settings()
         
         if self.settings_window:
             self.settings_window.destroy()
             self.settings_window = None
-        
-        messagebox.showinfo("Settings Saved", "Your settings have been saved and applied.")
+
+        # Drop references to the destroyed widgets so later saves or tab
+        # callbacks can't fire into dead Tk objects
+        self._settings_tabview = None
+        self._tabs_built = set()
+        self.api_key_entry = self.discord_id_entry = None
+        self.large_image_entry = self.small_image_entry = None
+
+        self.toast("Settings saved")
 
     def show_error(self, title: str, message: str):
         """Displays an error message box."""
@@ -1,9 +1,24 @@
 import os
 import json
+import queue
+import threading
+import time
+from collections import deque
 from datetime import datetime
 import customtkinter as ctk
 from tkinter import TclError
 
+# orjson's C encoder is several times faster than the stdlib for the
+# per-sample JSONL lines; fall back to compact stdlib json when absent.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
 class Logger:
     """
     Manages logging for the application, directing messages to a GUI textbox
@@ -19,9 +34,31 @@ class Logger:
         """
         self.log_text = log_textbox
         self.log_dir = log_dir
-        self.pending_logs = []
+        # Track widget liveness with a flag instead of asking the Tcl
+        # interpreter via winfo_exists() on every log line.
+        self._alive = log_textbox is not None
+        if log_textbox is not None:
+            try:
+                log_textbox.bind("<Destroy>", self._on_destroy, add="+")
+            except TclError:
+                self._alive = False
+        self.pending_logs = deque()
+        self._flush_scheduled = False
+        # Daily file paths are cached and only recomputed on date rollover
+        self._cached_day = -1
+        self._activity_path = None
+        self._heartrate_path = None
         self._setup_log_dir()
 
+        # All file appends go through a single worker thread so callers
+        # (including the Tk main loop) never block on disk I/O.
+        # Open append handles are cached per path (writer thread only)
+        # so each entry doesn't pay open/close syscalls.
+        self._handles = {}
+        self._write_queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="log-writer", daemon=True)
+        self._writer.start()
+
     def _setup_log_dir(self):
         """Creates the log directory if it doesn't exist."""
         try:
@@ -38,86 +75,192 @@ class Logger:
             message (str): The message to log.
             to_file (bool): Whether to save the log to a file.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
+        now = datetime.now()
+        log_message = f"[{now.strftime('%H:%M:%S')}] {message}\n"
 
-        try:
-            if self.log_text and self.log_text.winfo_exists():
-                self.log_text.insert("0.0", log_message)
-            else:
-                self.pending_logs.append(log_message)
-        except TclError:
-            # This can happen if the widget is destroyed
-            self.pending_logs.append(log_message)
+        # Always buffer; a scheduled flush batches lines into one insert,
+        # since every individual insert forces a text-widget reflow.
+        self.pending_logs.append(log_message)
+        self._schedule_flush()
 
         if to_file:
-            self.save_log_entry({"timestamp": datetime.now().isoformat(), "message": message})
+            self.save_log_entry({"timestamp": now.isoformat(), "message": message}, now=now)
 
-    def process_pending_logs(self):
-        """Writes any pending logs to the GUI textbox."""
+    def _on_destroy(self, event=None):
+        """Marks the textbox dead so log lines stop being handed to it."""
+        self._alive = False
+
+    def _schedule_flush(self):
+        """Schedules a single batched flush of buffered lines to the textbox."""
+        if self._flush_scheduled or not self._alive:
+            return
         try:
-            if self.log_text and self.log_text.winfo_exists():
-                while self.pending_logs:
-                    self.log_text.insert("0.0", self.pending_logs.pop(0))
+            self._flush_scheduled = True
+            self.log_text.after(100, self.process_pending_logs)
         except TclError:
-            # Widget might have been destroyed
+            # Widget is gone; lines stay buffered until it comes back
+            self._flush_scheduled = False
+            self._alive = False
+
+    def process_pending_logs(self):
+        """Writes any pending logs to the GUI textbox as a single insert."""
+        self._flush_scheduled = False
+        if not self.pending_logs or not self._alive:
+            return
+        # Drain via popleft so lines appended concurrently from other
+        # threads are neither dropped nor iterated mid-append; popleft
+        # is atomic where iteration is not.
+        lines = []
+        try:
+            while True:
+                lines.append(self.pending_logs.popleft())
+        except IndexError:
             pass
+        if not lines:
+            return
+        try:
+            # Newest line belongs at the top of the widget
+            batch = "".join(reversed(lines))
+            self.log_text.insert("0.0", batch)
+            # Cap the widget so it never grows without bound
+            self.log_text.delete("501.0", "end")
+        except TclError:
+            # Last-resort safety net if the widget vanished mid-update
+            self._alive = False
 
-    def save_log_entry(self, log_entry: dict):
+    def _refresh_paths(self, now: datetime):
+        """Recomputes the daily log file paths when the date rolls over."""
+        day = now.toordinal()
+        if day != self._cached_day:
+            self._cached_day = day
+            date_str = now.date().isoformat()
+            self._activity_path = os.path.join(self.log_dir, f"activity_{date_str}.jsonl")
+            self._heartrate_path = os.path.join(self.log_dir, f"heartrate_{date_str}.jsonl")
+
+    def save_log_entry(self, log_entry: dict, now: datetime = None):
         """
-        Saves a single log entry to the appropriate daily log file.
+        Queues a single log entry for appending to the daily log file.
+        Entries are stored as JSON lines, one object per line, so each
+        save is a constant-cost append instead of a full-file rewrite.
 
         Args:
             log_entry (dict): The log entry to save.
+            now (datetime): A timestamp the caller already fetched, if any.
         """
+        self._refresh_paths(now or datetime.now())
         try:
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            log_file = os.path.join(self.log_dir, f"activity_{current_date}.json")
-
-            data = {"logs": []}
-            if os.path.exists(log_file):
-                try:
-                    with open(log_file, 'r') as f:
-                        data = json.load(f)
-                except (json.JSONDecodeError, IOError):
-                    # If file is corrupted or empty, start fresh
-                    pass
-            
-            data.get("logs", []).append(log_entry)
-
-            with open(log_file, 'w') as f:
-                json.dump(data, f, indent=4)
-        except (IOError, TypeError) as e:
+            line = _dumps(log_entry) + '\n'
+        except TypeError as e:
             # Log this error to the GUI but not to file to avoid a loop
             self.log_activity(f"Error saving log entry: {e}", to_file=False)
+            return
+        self._write_queue.put((self._activity_path, line))
 
     def save_heart_rate_log(self, heart_rate: int):
         """
-        Saves heart rate data to a separate daily log file.
+        Queues heart rate data for appending to the daily heart rate log.
 
         Args:
             heart_rate (int): The heart rate measurement.
         """
-        try:
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            log_file = os.path.join(self.log_dir, f"heartrate_{current_date}.json")
+        now = datetime.now()
+        self._refresh_paths(now)
+
+        log_entry = {
+            "timestamp": now.isoformat(),
+            "heart_rate": heart_rate
+        }
 
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "heart_rate": heart_rate
-            }
+        line = _dumps(log_entry) + '\n'
+        self._write_queue.put((self._heartrate_path, line))
 
-            data = {"logs": []}
-            if os.path.exists(log_file):
+    def _writer_loop(self):
+        """Consumes queued log lines and appends them in per-file batches."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            # Give a burst of entries a moment to accumulate so they land
+            # in one write per file instead of one write per entry.
+            time.sleep(0.1)
+            batch = {}
+            while item is not None:
+                log_file, line = item
+                batch.setdefault(log_file, []).append(line)
                 try:
-                    with open(log_file, 'r') as f:
-                        data = json.load(f)
-                except (json.JSONDecodeError, IOError):
-                    pass
-            
-            data.get("logs", []).append(log_entry)
-
-            with open(log_file, 'w') as f:
-                json.dump(data, f, indent=4)
-        except (IOError, TypeError) as e:
-            self.log_activity(f"Error saving heart rate log: {e}", to_file=False)
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._flush_batch(batch)
+            if item is None:
+                break
+
+    def _get_handle(self, log_file: str):
+        """
+        Returns a cached append handle for the file, opening it on first
+        use. A new path for the same log kind only appears on date
+        rollover, at which point the previous day's handle is retired.
+        """
+        handle = self._handles.get(log_file)
+        if handle is None:
+            kind = os.path.basename(log_file).split('_', 1)[0]
+            for path in list(self._handles):
+                if os.path.basename(path).startswith(kind):
+                    self._handles.pop(path).close()
+            handle = open(log_file, 'a', encoding='utf-8', buffering=8192)
+            self._handles[log_file] = handle
+        return handle
+
+    def _flush_batch(self, batch: dict):
+        """Appends batched lines to their files, flushing once per file."""
+        for log_file, lines in batch.items():
+            try:
+                handle = self._get_handle(log_file)
+                handle.writelines(lines)
+                handle.flush()
+            except IOError as e:
+                # Drop the handle so the next batch reopens it fresh
+                bad = self._handles.pop(log_file, None)
+                if bad is not None:
+                    try:
+                        bad.close()
+                    except IOError:
+                        pass
+                self.log_activity(f"Error saving log entry: {e}", to_file=False)
+
+    def close(self):
+        """Drains queued log entries, stops the writer and closes handles."""
+        self._write_queue.put(None)
+        self._writer.join(timeout=2)
+        for handle in self._handles.values():
+            try:
+                handle.close()
+            except IOError:
+                pass
+        self._handles.clear()
+
+    @staticmethod
+    def load_log_entries(log_file: str) -> list:
+        """
+        Loads entries back from a JSON-lines log file.
+
+        Args:
+            log_file (str): The path to the .jsonl file.
+
+        Returns:
+            list: The parsed log entries. Unparseable lines are skipped.
+        """
+        entries = []
+        try:
+            with open(log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except IOError:
+            pass
+        return entries
@@ -1,23 +1,53 @@
+import time
 import psutil
 
-def is_process_running(process_name: str) -> bool:
+_DISCORD_PROCESSES = frozenset({'discord.exe', 'discord ptb.exe', 'discord canary.exe'})
+
+# One shared snapshot of running process names. Every caller reuses the
+# same enumeration, so the UI tick costs at most one process-table walk
+# per TTL window no matter how many predicates it evaluates.
+_proc_cache = {"ts": -float('inf'), "names": frozenset()}
+
+def _snapshot(ttl: float = 2.0) -> frozenset:
     """
-    Checks if a process with the given name is currently running.
+    Returns the set of lowercased names of running processes, refreshed
+    at most once per `ttl` seconds.
 
     Args:
-        process_name (str): The name of the process executable (e.g., "Discord.exe").
+        ttl (float): How long a snapshot stays valid, in seconds.
 
     Returns:
-        bool: True if the process is running, False otherwise.
+        frozenset: Lowercased process names.
     """
+    now = time.monotonic()
+    if now - _proc_cache["ts"] < ttl:
+        return _proc_cache["names"]
+
+    names = set()
     try:
         for p in psutil.process_iter(['name']):
-            if p.info['name'].lower() == process_name.lower():
-                return True
+            name = p.info['name']
+            if name:
+                names.add(name.casefold())
     except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
         # These exceptions can occur, just ignore them
         pass
-    return False
+
+    _proc_cache["ts"] = now
+    _proc_cache["names"] = frozenset(names)
+    return _proc_cache["names"]
+
+def is_process_running(process_name: str) -> bool:
+    """
+    Checks if a process with the given name is currently running.
+
+    Args:
+        process_name (str): The name of the process executable (e.g., "Discord.exe").
+
+    Returns:
+        bool: True if the process is running, False otherwise.
+    """
+    return process_name.casefold() in _snapshot()
 
 def is_discord_running() -> bool:
     """
@@ -26,10 +56,4 @@ def is_discord_running() -> bool:
     Returns:
         bool: True if Discord is running, False otherwise.
     """
-    discord_processes = ['discord.exe', 'discord ptb.exe', 'discord canary.exe']
-    try:
-        running_processes = [p.info['name'].lower() for p in psutil.process_iter(['name'])]
-        return any(proc in running_processes for proc in discord_processes)
-    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-        pass
-    return False
\ No newline at end of file
+    return bool(_snapshot() & _DISCORD_PROCESSES)
@@ -1,8 +1,20 @@
-from pythonosc import udp_client
+import time
+from pythonosc import osc_bundle_builder, osc_message_builder, udp_client
 from .utils import is_process_running
 from .logger import Logger
 from typing import Optional
 
+ADDR_HR = "/avatar/parameters/HR"
+ADDR_HR_PERCENT = "/avatar/parameters/HRPercent"
+ADDR_HR_CONNECTED = "/avatar/parameters/isHRConnected"
+
+# Parameter values sent when no heart rate is available
+_RESET_PARAMS = (0, 0.0, False)
+
+# HRPercent maps 40-200 BPM onto 0.0-1.0; multiply by the precomputed
+# reciprocal instead of dividing per update
+_INV_RANGE = 1.0 / 160.0
+
 class VRChatOSC:
     """
     Manages the OSC connection and parameter updates for VRChat.
@@ -19,6 +31,12 @@ class VRChatOSC:
         self.logger = logger
         self.client = udp_client.SimpleUDPClient(ip, port)
         self.is_connected = False
+        self._last_sent = None
+        # VRChat rarely starts or stops mid-session, so the per-tick
+        # running check can ride on a longer grace period than the
+        # process snapshot's TTL.
+        self._vrc_running = False
+        self._vrc_running_ts = -float('inf')
         self._check_connection()
 
     def _check_connection(self):
@@ -49,20 +67,39 @@ class VRChatOSC:
         Args:
             heart_rate (Optional[int]): The current heart rate. If None, resets parameters.
         """
-        if not self.is_connected or not self.is_vrchat_running():
+        if not self.is_connected:
+            return
+
+        now = time.monotonic()
+        if now - self._vrc_running_ts > 5.0:
+            self._vrc_running = self.is_vrchat_running()
+            self._vrc_running_ts = now
+        if not self._vrc_running:
             return
 
         try:
             if heart_rate is not None:
-                self.client.send_message("/avatar/parameters/HR", int(heart_rate))
-                hr_percent = min(max((heart_rate - 40) / (200 - 40), 0.0), 1.0)
-                self.client.send_message("/avatar/parameters/HRPercent", hr_percent)
-                self.client.send_message("/avatar/parameters/isHRConnected", True)
+                hr = int(heart_rate)
+                hr_percent = (hr - 40) * _INV_RANGE
+                hr_percent = 0.0 if hr_percent < 0.0 else (1.0 if hr_percent > 1.0 else hr_percent)
+                params = (hr, hr_percent, True)
             else:
                 # Reset parameters if heart rate is not available
-                self.client.send_message("/avatar/parameters/HR", 0)
-                self.client.send_message("/avatar/parameters/HRPercent", 0.0)
-                self.client.send_message("/avatar/parameters/isHRConnected", False)
+                params = _RESET_PARAMS
+
+            # UDP sends are syscalls; skip them when nothing changed
+            if params == self._last_sent:
+                return
+
+            # Bundle all three parameters into one datagram instead of
+            # three separate sendto calls
+            bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+            for address, value in zip((ADDR_HR, ADDR_HR_PERCENT, ADDR_HR_CONNECTED), params):
+                msg = osc_message_builder.OscMessageBuilder(address=address)
+                msg.add_arg(value)
+                bundle.add_content(msg.build())
+            self.client.send(bundle.build())
+            self._last_sent = params
         except Exception as e:
             self.logger.log_activity(f"Failed to send VRChat OSC message: {e}")
             self.is_connected = False
\ No newline at end of file